@@ -0,0 +1,220 @@
+import io
+import os
+import re
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable
+from uuid import NAMESPACE_URL, uuid5
+from zoneinfo import ZoneInfo
+
+import requests_cache
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+BASE_URL = "https://footballmundial.com"
+LEAGUE_PAGE_URL = "https://footballmundial.com/find_league"
+HTTP_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible;)"}
+
+FIXTURES_SOURCE_URL = "https://footballmundial.com/info/teams/770267"
+TEAM_NAME = "CLIVE OWEN & CO"
+OUTPUT_DIRECTORY = os.path.join("docs")
+ICS_OUTPUT_FILENAME = "clive_owen_fixtures.ics"
+ICS_OUTPUT_PATH = os.path.join(OUTPUT_DIRECTORY, ICS_OUTPUT_FILENAME)
+DEFAULT_EVENT_LOCATION = "301 Huntington Rd, Huntington, York YO32 9WT"
+TIME_ZONE = ZoneInfo("Europe/London")
+UTC = ZoneInfo("UTC")
+ICS_DATETIME_FORMAT = "%Y%m%dT%H%M%SZ"
+EVENT_DURATION = "PT1H"
+
+_FIXTURES_HEADING_RE = re.compile(r"\s*CLIVE OWEN & CO Fixtures\s*")
+
+# On-disk caches live outside OUTPUT_DIRECTORY, which is published as-is
+CACHE_DIRECTORY = ".cache"
+
+# Pages are cached on disk between runs; venues and the league directory
+# barely change, so they are kept much longer than fixture pages.
+HTTP_CACHE_PATH = os.path.join(CACHE_DIRECTORY, "http_cache")
+HTTP_CACHE_EXPIRE_AFTER = timedelta(hours=6)
+HTTP_CACHE_URLS_EXPIRE_AFTER = {
+    "*/info/venues/*": timedelta(days=30),
+    "*/find_league": timedelta(days=7),
+}
+
+
+@lru_cache(maxsize=None)
+def get_session() -> requests_cache.CachedSession:
+    """
+    Return the single keep-alive, cached Session for all synchronous HTTP
+    calls. It is built on first use so importing this module creates no
+    cache file.
+    """
+    session = requests_cache.CachedSession(
+        cache_name=HTTP_CACHE_PATH,
+        backend="sqlite",
+        expire_after=HTTP_CACHE_EXPIRE_AFTER,
+        urls_expire_after=HTTP_CACHE_URLS_EXPIRE_AFTER,
+        allowable_methods=["GET"],
+    )
+    session.headers.update(HTTP_HEADERS)
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=32))
+    return session
+
+
+def _parse_ddmmyy_hhmm(date_string: str, time_string: str) -> datetime:
+    """
+    Parse a "dd/mm/yy" date and "HH:MM" time into a local datetime without
+    going through strptime.
+    """
+    day, month, year = date_string.split("/")
+    hour, minute = time_string.split(":")
+    return datetime(
+        2000 + int(year), int(month), int(day), int(hour), int(minute), tzinfo=TIME_ZONE
+    )
+
+
+def fetch_team_fixtures(target_date: date | None = None) -> list[tuple[datetime, str]]:
+    """
+    Retrieve upcoming fixtures for the team from the remote schedule page.
+    If target_date is given, only fixtures on that date are returned; rows are
+    in date order, so parsing stops at the first later fixture.
+    """
+    response = get_session().get(FIXTURES_SOURCE_URL)
+    response.raise_for_status()
+    page_soup = BeautifulSoup(response.content, "lxml")
+
+    fixtures_heading = page_soup.find(
+        "h4", class_="panel-title", string=_FIXTURES_HEADING_RE
+    )
+    if fixtures_heading is None:
+        raise RuntimeError("Unable to locate the fixtures section for the home team.")
+
+    fixtures_container = fixtures_heading.find_parent("div", class_="col-lg-6")
+    table_rows = fixtures_container.select("table.table-striped tbody tr")
+
+    fixtures_list: list[tuple[datetime, str]] = []
+    for table_row in table_rows:
+        cells = table_row.find_all("td")
+        raw_datetime = cells[0].get_text(separator=" ").strip()
+        date_string, time_string = raw_datetime.split()
+        fixture_datetime = _parse_ddmmyy_hhmm(date_string, time_string)
+        if target_date is not None:
+            if fixture_datetime.date() > target_date:
+                break
+            if fixture_datetime.date() < target_date:
+                continue
+
+        home_team_cell = cells[1].get_text(strip=True)
+        away_team_cell = cells[3].get_text(strip=True)
+
+        if home_team_cell == TEAM_NAME:
+            opponent_team = away_team_cell
+        elif away_team_cell == TEAM_NAME:
+            opponent_team = home_team_cell
+        else:
+            continue
+
+        fixtures_list.append((fixture_datetime, opponent_team))
+
+    return fixtures_list
+
+
+def escape_ics_text(text: str) -> str:
+    """
+    Escape a TEXT property value as required by RFC 5545.
+    """
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def event_uid(*parts: str) -> str:
+    """
+    Derive a stable UID from the fields identifying an event, so calendar
+    clients see the same event across regenerated feeds.
+    """
+    return str(uuid5(NAMESPACE_URL, "|".join(parts)))
+
+
+@lru_cache(maxsize=1024)
+def vevent_body(
+    dtstart: datetime | str,
+    duration: str,
+    location: str,
+    description: str | None = None,
+) -> str:
+    """
+    Render the summary-independent lines of a VEVENT. The league calendar and
+    both teams' calendars share the same body for a fixture, so it is
+    formatted once and spliced into each. dtstart may also be passed already
+    formatted as a UTC ICS timestamp.
+    """
+    if isinstance(dtstart, datetime):
+        dtstart = dtstart.astimezone(UTC).strftime(ICS_DATETIME_FORMAT)
+    lines = [
+        f"DTSTART:{dtstart}",
+        f"DURATION:{duration}",
+        f"LOCATION:{escape_ics_text(location)}",
+    ]
+    if description:
+        lines.append(f"DESCRIPTION:{escape_ics_text(description)}")
+    return "\r\n".join(lines) + "\r\n"
+
+
+def vevent(
+    uid: str,
+    dtstart: datetime | str,
+    duration: str,
+    summary: str,
+    location: str,
+    description: str | None = None,
+) -> str:
+    """
+    Return a single BEGIN:VEVENT ... END:VEVENT block, CRLF terminated.
+    """
+    return (
+        f"BEGIN:VEVENT\r\nUID:{uid}\r\nSUMMARY:{escape_ics_text(summary)}\r\n"
+        f"{vevent_body(dtstart, duration, location, description)}"
+        "END:VEVENT\r\n"
+    )
+
+
+def vcalendar(prodid: str, events: Iterable[str]) -> str:
+    """
+    Wrap pre-rendered VEVENT blocks in a VCALENDAR.
+    """
+    buffer = io.StringIO()
+    buffer.write(f"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:{prodid}\r\n")
+    for event in events:
+        buffer.write(event)
+    buffer.write("END:VCALENDAR\r\n")
+    return buffer.getvalue()
+
+
+def build_calendar(fixtures: list[tuple[datetime, str]]) -> str:
+    """
+    Construct an iCalendar document from the list of fixtures.
+    """
+    return vcalendar(
+        "-//Aydin Aksel//Clive Owen Fixtures//EN",
+        (
+            vevent(
+                event_uid(TEAM_NAME, fixture_datetime.isoformat(), opponent_team),
+                fixture_datetime,
+                EVENT_DURATION,
+                f"Match Versus {opponent_team}",
+                DEFAULT_EVENT_LOCATION,
+            )
+            for fixture_datetime, opponent_team in fixtures
+        ),
+    )
+
+
+def write_calendar(path: str, calendar_text: str) -> None:
+    """
+    Write an already serialized calendar with a single call.
+    """
+    Path(path).write_bytes(calendar_text.encode("utf-8"))
@@ -0,0 +1,102 @@
+import json
+import time
+from datetime import timedelta
+from fnmatch import fnmatch
+from hashlib import sha1
+from pathlib import Path
+from typing import Mapping
+
+
+class PageCache:
+    """
+    On-disk page cache for the async crawler. Fresh pages are served without
+    touching the network; stale pages are revalidated with If-None-Match /
+    If-Modified-Since so an unchanged page costs a 304 and no download.
+
+    Validators live in a meta.json sidecar keyed by URL, and each body is
+    stored in its own file next to it.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        expire_after: timedelta,
+        urls_expire_after: Mapping[str, timedelta] | None = None,
+    ):
+        self.directory = Path(directory)
+        self.meta_path = self.directory / "meta.json"
+        self.expire_after = expire_after
+        self.urls_expire_after = urls_expire_after or {}
+        try:
+            self.records: dict[str, dict] = json.loads(self.meta_path.read_text())
+        except (FileNotFoundError, ValueError):
+            self.records = {}
+
+    def _expire_after_for(self, url: str) -> timedelta:
+        address = url.split("://")[-1]
+        for pattern, expire_after in self.urls_expire_after.items():
+            if fnmatch(address, pattern):
+                return expire_after
+        return self.expire_after
+
+    def _read_body(self, url: str) -> bytes | None:
+        record = self.records.get(url)
+        if record is None:
+            return None
+        try:
+            return (self.directory / record["body_path"]).read_bytes()
+        except FileNotFoundError:
+            del self.records[url]
+            return None
+
+    def fresh_body(self, url: str) -> bytes | None:
+        """
+        Return the stored body if it is still within its expiry window.
+        """
+        record = self.records.get(url)
+        if record is None:
+            return None
+        age = time.time() - record["fetched_at"]
+        if age > self._expire_after_for(url).total_seconds():
+            return None
+        return self._read_body(url)
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """
+        Build the revalidation headers for a stale entry, if it has validators.
+        """
+        record = self.records.get(url)
+        if record is None or not (self.directory / record["body_path"]).exists():
+            return {}
+        headers = {}
+        if record.get("etag"):
+            headers["If-None-Match"] = record["etag"]
+        if record.get("last_modified"):
+            headers["If-Modified-Since"] = record["last_modified"]
+        return headers
+
+    def revalidated(self, url: str) -> bytes:
+        """
+        Handle a 304: restart the entry's expiry window and return its body.
+        """
+        record = self.records[url]
+        record["fetched_at"] = time.time()
+        return (self.directory / record["body_path"]).read_bytes()
+
+    def store(self, url: str, body: bytes, headers: Mapping[str, str]) -> None:
+        """
+        Record a 200 response and the validators the origin sent with it.
+        """
+        body_path = sha1(url.encode("utf-8")).hexdigest() + ".html"
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / body_path).write_bytes(body)
+        self.records[url] = {
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "body_path": body_path,
+            "fetched_at": time.time(),
+        }
+
+    def save(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.meta_path.write_text(json.dumps(self.records, indent=2))
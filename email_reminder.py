@@ -5,10 +5,8 @@ import smtplib
 import ssl
 from email.message import EmailMessage
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
-from generate_ics import fetch_team_fixtures
+from clive_fixtures.core import TIME_ZONE, fetch_team_fixtures
 
-TIME_ZONE = ZoneInfo("Europe/London")
 DAYS_BEFORE_REMINDER = 0
 
 SMTP_HOST = os.environ["SMTP_HOST"]
@@ -19,9 +17,12 @@ EMAIL_SENDER_ADDRESS = os.environ.get("EMAIL_SENDER_ADDRESS", SMTP_USERNAME)
 EMAIL_RECIPIENT_LIST = os.environ["RECIPIENTS"].split(",")
 
 
-def send_reminder(fixture_datetime: datetime, opponent_team: str) -> None:
+def send_reminder(
+    smtp_connection: smtplib.SMTP, fixture_datetime: datetime, opponent_team: str
+) -> None:
     """
-    Send an email reminder for the given fixture date/time and opponent.
+    Send an email reminder for the given fixture date/time and opponent over an
+    already authenticated SMTP connection.
     """
     fixture_time = fixture_datetime.strftime("%H:%M")
 
@@ -38,25 +39,37 @@ def send_reminder(fixture_datetime: datetime, opponent_team: str) -> None:
     )
     message.set_content(email_body)
 
-    ssl_context = ssl.create_default_context()
-    with smtplib.SMTP_SSL(
-        host=SMTP_HOST, port=SMTP_PORT, context=ssl_context, timeout=10
-    ) as smtp_connection:
-        smtp_connection.login(SMTP_USERNAME, SMTP_PASSWORD)
-        smtp_connection.send_message(message)
+    smtp_connection.send_message(message)
 
 
 def main() -> None:
     """
     Fetch fixtures and send reminders for any fixtures happening today + DAYS_BEFORE_REMINDER.
     """
-    upcoming_fixtures = fetch_team_fixtures()
     current_datetime = datetime.now(TIME_ZONE)
     reminder_date = (current_datetime + timedelta(days=DAYS_BEFORE_REMINDER)).date()
 
-    for fixture_datetime, opponent_team in upcoming_fixtures:
-        if fixture_datetime.date() == reminder_date:
-            send_reminder(fixture_datetime, opponent_team)
+    reminder_fixtures = fetch_team_fixtures(reminder_date)
+    if not reminder_fixtures:
+        return
+
+    failed_opponents = []
+    ssl_context = ssl.create_default_context()
+    with smtplib.SMTP_SSL(
+        host=SMTP_HOST, port=SMTP_PORT, context=ssl_context, timeout=10
+    ) as smtp_connection:
+        smtp_connection.login(SMTP_USERNAME, SMTP_PASSWORD)
+        for fixture_datetime, opponent_team in reminder_fixtures:
+            try:
+                send_reminder(smtp_connection, fixture_datetime, opponent_team)
+            except smtplib.SMTPException as error:
+                print(f"Failed to send reminder versus {opponent_team}: {error}")
+                failed_opponents.append(opponent_team)
+
+    if failed_opponents:
+        raise RuntimeError(
+            f"Could not send reminders versus: {', '.join(failed_opponents)}"
+        )
 
 
 if __name__ == "__main__":
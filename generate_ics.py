@@ -2,38 +2,111 @@
 
 import os
 import re
-import time
-import json
-from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
-
-import requests
+import asyncio
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic
+from urllib.parse import urlsplit
+from datetime import date, datetime, time
+from typing import Iterator
+
+import aiohttp
+import orjson
 from bs4 import BeautifulSoup
-from ics import Calendar, Event
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+
+from clive_fixtures.core import (
+    BASE_URL,
+    CACHE_DIRECTORY,
+    DEFAULT_EVENT_LOCATION,
+    EVENT_DURATION,
+    HTTP_CACHE_EXPIRE_AFTER,
+    HTTP_CACHE_URLS_EXPIRE_AFTER,
+    HTTP_HEADERS,
+    LEAGUE_PAGE_URL,
+    OUTPUT_DIRECTORY,
+    TIME_ZONE,
+    event_uid,
+    vcalendar,
+    vevent,
+    write_calendar,
+)
+from clive_fixtures.page_cache import PageCache
+
+MAX_CONCURRENT_REQUESTS_PER_HOST = 16
+MIN_REQUEST_INTERVAL_SECONDS = 0.1
+ICS_WRITER_WORKERS = 8
+PARSER_WORKERS = 4
+
+_VENUE_HREF_RE = re.compile(r"^/info/venues/\d+")
+_ADDRESS_LABEL_RE = re.compile(r"^\s*Address\s*$")
+
+CRAWL_CACHE_DIRECTORY = os.path.join(CACHE_DIRECTORY, "crawl")
+
+PARSER_POOL = ThreadPoolExecutor(max_workers=PARSER_WORKERS)
+
+PAGE_CACHE = PageCache(
+    CRAWL_CACHE_DIRECTORY, HTTP_CACHE_EXPIRE_AFTER, HTTP_CACHE_URLS_EXPIRE_AFTER
+)
+
+_host_semaphores: dict[str, asyncio.Semaphore] = {}
+_host_locks: dict[str, asyncio.Lock] = {}
+_last_request_times: dict[str, float] = {}
+
+# Leagues often share a venue; concurrent lookups for the same URL await
+# one in-flight fetch instead of each downloading the page.
+_venue_address_tasks: dict[str, asyncio.Task] = {}
+
+
+async def fetch(session: aiohttp.ClientSession, url: str) -> bytes:
+    """
+    GET a page through the shared session and return its raw body, keeping at most
+    MAX_CONCURRENT_REQUESTS_PER_HOST requests in flight against any one host.
+    Fresh pages come straight from PAGE_CACHE; stale ones are revalidated with
+    a conditional GET and reused on 304.
+    """
+    cached_body = PAGE_CACHE.fresh_body(url)
+    if cached_body is not None:
+        return cached_body
+
+    host = urlsplit(url).hostname
+    semaphore = _host_semaphores.setdefault(
+        host, asyncio.Semaphore(MAX_CONCURRENT_REQUESTS_PER_HOST)
+    )
+
+    async with semaphore:
+        await _wait_for_request_slot(host)
+        async with session.get(
+            url, headers=PAGE_CACHE.conditional_headers(url)
+        ) as response:
+            if response.status == 304:
+                return PAGE_CACHE.revalidated(url)
+            response.raise_for_status()
+            body = await response.read()
 
-BASE_URL = "https://footballmundial.com"
+    PAGE_CACHE.store(url, body, response.headers)
+    return body
 
-LEAGUE_PAGE_URL = "https://footballmundial.com/find_league"
-HTTP_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible;)"}
 
-FIXTURES_SOURCE_URL = "https://footballmundial.com/info/teams/770267"
-TEAM_NAME = "CLIVE OWEN & CO"
-HTTP_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible;)"}
-OUTPUT_DIRECTORY = os.path.join("docs")
-ICS_OUTPUT_FILENAME = "clive_owen_fixtures.ics"
-ICS_OUTPUT_PATH = os.path.join(OUTPUT_DIRECTORY, ICS_OUTPUT_FILENAME)
-DEFAULT_EVENT_LOCATION = "301 Huntington Rd, Huntington, York YO32 9WT"
-TIME_ZONE = ZoneInfo("Europe/London")
+async def _wait_for_request_slot(host: str) -> None:
+    """
+    Sleep only as long as needed to keep MIN_REQUEST_INTERVAL_SECONDS between
+    the starts of consecutive requests to the same host.
+    """
+    lock = _host_locks.setdefault(host, asyncio.Lock())
+    async with lock:
+        elapsed = monotonic() - _last_request_times.get(host, float("-inf"))
+        await asyncio.sleep(max(0.0, MIN_REQUEST_INTERVAL_SECONDS - elapsed))
+        _last_request_times[host] = monotonic()
 
 
-def fetch_league_names_and_urls():
+async def fetch_league_names_and_urls(session: aiohttp.ClientSession):
     """
     Extract league names and their relative URLs from the league dropdown.
     """
-    response = requests.get(LEAGUE_PAGE_URL, headers=HTTP_HEADERS)
-    response.raise_for_status()
+    page_content = await fetch(session, LEAGUE_PAGE_URL)
 
-    page_soup = BeautifulSoup(response.text, "html.parser")
+    page_soup = BeautifulSoup(page_content, "lxml")
 
     select_element = page_soup.find(
         "select",
@@ -55,39 +128,33 @@ def fetch_league_names_and_urls():
     return leagues
 
 
-def parse_league_group(group_name: str, group_url: str):
+async def parse_league_group(
+    session: aiohttp.ClientSession, group_name: str, group_url: str
+):
     full_url = BASE_URL + group_url
-    response = requests.get(full_url, headers=HTTP_HEADERS)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.text, "html.parser")
+    page_content = await fetch(session, full_url)
+    soup = BeautifulSoup(page_content, "lxml")
 
     league_data = {"group_name": group_name, "group_url": group_url, "leagues": []}
 
-    panels = soup.find_all("div", class_="col-lg-12")
-    for panel in panels:
-        title_div = panel.find("div", class_="panel-heading")
-        if not title_div:
-            continue
-
-        league_name_tag = title_div.find("h4", class_="panel-title")
-        if not league_name_tag:
+    for league_name_tag in soup.select(
+        "div.col-lg-12 div.panel-heading h4.panel-title"
+    ):
+        link_tag = league_name_tag.select_one("a[href]")
+        league_url = link_tag["href"] if link_tag else None
+        if not league_url:
             continue
 
         league_name = (
             league_name_tag.get_text(strip=True).split("View Fixtures")[0].strip()
         )
-        link_tag = league_name_tag.find("a", href=True)
-        league_url = link_tag["href"] if link_tag else None
-        if not league_url:
-            continue
-
-        table = panel.find("table", class_="table-striped")
-        team_names = []
-        if table:
-            for row in table.select("tbody tr"):
-                team_div = row.find("div", class_="team_name_with_colour")
-                if team_div:
-                    team_names.append(team_div.get_text(strip=True))
+        panel = league_name_tag.find_parent("div", class_="col-lg-12")
+        team_names = [
+            team_div.get_text(strip=True)
+            for team_div in panel.select(
+                "table.table-striped tbody tr div.team_name_with_colour"
+            )
+        ]
 
         league_data["leagues"].append(
             {"name": league_name, "url": league_url, "teams": team_names}
@@ -96,59 +163,108 @@ def parse_league_group(group_name: str, group_url: str):
     return league_data
 
 
-def extract_fixtures_from_league(league_url: str):
-    response = requests.get(BASE_URL + league_url, headers=HTTP_HEADERS)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.text, "html.parser")
+def _parse_dd_mm_yyyy(date_string: str) -> date:
+    """
+    Parse a "dd-mm-yyyy" date without going through strptime.
+    """
+    day, month, year = date_string.split("-")
+    return date(int(year), int(month), int(day))
+
+
+def _parse_hh_mm(time_string: str) -> time:
+    """
+    Parse an "HH:MM" time without going through strptime.
+    """
+    hour, minute = time_string.split(":")
+    return time(int(hour), int(minute))
+
+
+def _next_sibling_div(node: LexborNode, class_name: str) -> LexborNode | None:
+    """
+    Return the first following sibling <div> carrying class_name, if any.
+    """
+    sibling = node.next
+    while sibling is not None:
+        if (
+            sibling.tag == "div"
+            and class_name in (sibling.attributes.get("class") or "").split()
+        ):
+            return sibling
+        sibling = sibling.next
+    return None
+
+
+async def extract_fixtures_from_league(session: aiohttp.ClientSession, league_url: str):
+    page_content = await fetch(session, BASE_URL + league_url)
+
+    # Parsing runs on PARSER_POOL so it overlaps with other pages' network
+    # waits instead of blocking the event loop.
+    loop = asyncio.get_running_loop()
+    fixtures, venue = await loop.run_in_executor(
+        PARSER_POOL, _parse_league_page, page_content, league_url
+    )
+
+    if venue["url"]:
+        venue["address"] = await fetch_venue_address(session, venue["url"])
+
+    return fixtures, venue
+
+
+def _parse_league_page(page_content: bytes, league_url: str) -> tuple[list[dict], dict]:
+    tree = LexborHTMLParser(page_content)
 
-    venue_link = soup.find("a", href=re.compile(r"^/info/venues/\d+"))
+    venue_link = next(
+        (
+            link
+            for link in tree.css('a[href^="/info/venues/"]')
+            if _VENUE_HREF_RE.match(link.attributes["href"])
+        ),
+        None,
+    )
     venue = {
-        "name": venue_link.text.strip() if venue_link else "Unknown Venue",
-        "url": venue_link["href"] if venue_link else None,
+        "name": venue_link.text().strip() if venue_link else "Unknown Venue",
+        "url": venue_link.attributes["href"] if venue_link else None,
         "address": None,
     }
 
-    if venue["url"]:
-        venue["address"] = fetch_venue_address(venue["url"])
-
     fixtures = []
 
     for section_id in ["fixtures_accordion_fixtures", "fixtures_accordion_results"]:
-        accordion = soup.find("div", id=section_id)
+        accordion = tree.css_first(f"div#{section_id}")
         if not accordion:
             continue
 
         # Look for all date headers
-        date_panels = accordion.find_all("div", class_="panel-heading")
+        date_panels = accordion.css("div.panel-heading")
         for panel in date_panels:
-            title_tag = panel.find("h4", class_="panel-title")
+            title_tag = panel.css_first("h4.panel-title")
             if not title_tag:
                 continue
 
-            date_text = title_tag.get_text(strip=True).replace("View:", "").strip()
+            date_text = title_tag.text(strip=True).replace("View:", "").strip()
             try:
-                match_date = datetime.strptime(date_text, "%d-%m-%Y").date()
+                match_date = _parse_dd_mm_yyyy(date_text)
             except ValueError:
                 continue
 
             # Get the div with fixtures for that matchday
-            content_div = panel.find_next_sibling("div", class_="panel-collapse")
+            content_div = _next_sibling_div(panel, "panel-collapse")
             if not content_div:
                 continue
 
-            table = content_div.find("table", class_="table-striped")
+            table = content_div.css_first("table.table-striped")
             if not table:
                 continue
 
-            rows = table.select("tbody tr")
+            rows = table.css("tbody tr")
             for row in rows:
-                cells = row.find_all("td")
+                cells = row.css("td")
                 if len(cells) < 4:
                     continue
 
-                time_str = cells[0].text.strip()
+                time_str = cells[0].text().strip()
                 try:
-                    fixture_time = datetime.strptime(time_str, "%H:%M").time()
+                    fixture_time = _parse_hh_mm(time_str)
                 except ValueError:
                     continue
 
@@ -156,41 +272,55 @@ def extract_fixtures_from_league(league_url: str):
                     tzinfo=TIME_ZONE
                 )
 
-                home_link = cells[1].find("a")
-                away_link = cells[3].find("a")
+                home_link = cells[1].css_first("a")
+                away_link = cells[3].css_first("a")
                 if not home_link or not away_link:
                     continue
 
                 fixture = {
                     "datetime": fixture_datetime,
-                    "home": {"name": home_link.text.strip(), "url": home_link["href"]},
-                    "away": {"name": away_link.text.strip(), "url": away_link["href"]},
+                    "home": {
+                        "name": home_link.text().strip(),
+                        "url": home_link.attributes["href"],
+                    },
+                    "away": {
+                        "name": away_link.text().strip(),
+                        "url": away_link.attributes["href"],
+                    },
                     "result": None,
                     "league_url": league_url,
                 }
 
                 # Add result if present (only in past results section)
                 if section_id == "fixtures_accordion_results":
-                    fixture["result"] = cells[2].text.strip()
+                    fixture["result"] = cells[2].text().strip()
 
                 fixtures.append(fixture)
 
     return fixtures, venue
 
 
-def fetch_venue_address(venue_url: str) -> str:
+async def fetch_venue_address(session: aiohttp.ClientSession, venue_url: str) -> str:
     """
     Given a relative venue URL like /info/venues/3940, return a cleaned-up address string.
+    Each venue is fetched at most once per run.
     """
     if not venue_url:
         return DEFAULT_EVENT_LOCATION
 
+    if venue_url not in _venue_address_tasks:
+        _venue_address_tasks[venue_url] = asyncio.create_task(
+            _scrape_venue_address(session, venue_url)
+        )
+    return await _venue_address_tasks[venue_url]
+
+
+async def _scrape_venue_address(session: aiohttp.ClientSession, venue_url: str) -> str:
     full_url = BASE_URL + venue_url
-    response = requests.get(full_url, headers=HTTP_HEADERS)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.text, "html.parser")
+    page_content = await fetch(session, full_url)
+    soup = BeautifulSoup(page_content, "lxml")
 
-    address_block = soup.find("p", string=re.compile(r"^\s*Address\s*$"))
+    address_block = soup.find("p", string=_ADDRESS_LABEL_RE)
     if not address_block:
         return DEFAULT_EVENT_LOCATION
 
@@ -209,127 +339,111 @@ def fetch_venue_address(venue_url: str) -> str:
     return ", ".join(address_lines) if address_lines else DEFAULT_EVENT_LOCATION
 
 
-def fetch_team_fixtures() -> list[tuple[datetime, str]]:
-    """
-    Retrieve upcoming fixtures for the team from the remote schedule page.
-    """
-    response = requests.get(FIXTURES_SOURCE_URL, headers=HTTP_HEADERS)
-    response.raise_for_status()
-    page_soup = BeautifulSoup(response.text, "html.parser")
+async def build_group_info(
+    session: aiohttp.ClientSession, group_name: str, group_url: str
+):
+    print(f"Processing league group: {group_name} ({group_url})")
+    group_info = {"group_name": group_name, "group_url": group_url, "leagues": []}
 
-    fixtures_heading = page_soup.find(
-        "h4", class_="panel-title", string=re.compile(r"\s*CLIVE OWEN & CO Fixtures\s*")
+    parsed_group = await parse_league_group(session, group_name, group_url)
+    league_results = await asyncio.gather(
+        *(
+            extract_fixtures_from_league(session, league["url"])
+            for league in parsed_group["leagues"]
+        )
     )
-    if fixtures_heading is None:
-        raise RuntimeError("Unable to locate the fixtures section for the home team.")
-
-    fixtures_container = fixtures_heading.find_parent("div", class_="col-lg-6")
-    table_rows = fixtures_container.select("table.table-striped tbody tr")
-
-    fixtures_list: list[tuple[datetime, str]] = []
-    for table_row in table_rows:
-        raw_datetime = table_row.td.get_text(separator=" ").strip()
-        date_string, time_string = raw_datetime.split()
-        fixture_datetime = datetime.strptime(
-            f"{date_string} {time_string}", "%d/%m/%y %H:%M"
-        ).replace(tzinfo=TIME_ZONE)
-
-        home_team_cell = table_row.select("td")[1].get_text(strip=True)
-        away_team_cell = table_row.select("td")[3].get_text(strip=True)
-
-        if home_team_cell == TEAM_NAME:
-            opponent_team = away_team_cell
-        elif away_team_cell == TEAM_NAME:
-            opponent_team = home_team_cell
-        else:
-            continue
 
-        fixtures_list.append((fixture_datetime, opponent_team))
+    for league, (league_fixtures, venue_info) in zip(
+        parsed_group["leagues"], league_results
+    ):
+        team_map = defaultdict(list)
+        for fx in league_fixtures:
+            home, away = fx["home"]["name"], fx["away"]["name"]
+            for team, opponent in ((home, away), (away, home)):
+                team_map[team].append(
+                    {
+                        "team": team,
+                        "opponent": opponent,
+                        "datetime": fx["datetime"],
+                        "result": fx["result"],
+                    }
+                )
 
-    return fixtures_list
+        group_info["leagues"].append(
+            {
+                "league_name": league["name"],
+                "league_url": league["url"],
+                "venue": venue_info,
+                "fixtures": league_fixtures,
+                "teams": team_map,
+            }
+        )
 
+    return group_info
 
-def build_calendar(fixtures: list[tuple[datetime, str]]) -> Calendar:
-    """
-    Construct an iCalendar object from the list of fixtures.
-    """
-    calendar = Calendar()
-    calendar.creator = "-//Aydin Aksel//Clive Owen Fixtures//EN"
-
-    for fixture_datetime, opponent_team in fixtures:
-        event = Event()
-        event.name = f"Match Versus {opponent_team}"
-        event.begin = fixture_datetime
-        event.duration = timedelta(hours=1)
-        event.location = DEFAULT_EVENT_LOCATION
-        calendar.events.add(event)
-
-    return calendar
-
-
-def build_leaguegroup_fixture_manifest(limit: int = None):
-    all_data = []
-
-    league_groups = fetch_league_names_and_urls()
-    if limit is not None:
-        league_groups = league_groups[:limit]
-
-    for group_name, group_url in league_groups:
-        print(f"Processing league group: {group_name} ({group_url})")
-        group_info = {"group_name": group_name, "group_url": group_url, "leagues": []}
-
-        parsed_group = parse_league_group(group_name, group_url)
-        for league in parsed_group["leagues"]:
-            league_fixtures, venue_info = extract_fixtures_from_league(league["url"])
-
-            team_map = {}
-            for fx in league_fixtures:
-                for side in ["home", "away"]:
-                    name = fx[side]["name"]
-                    team_map.setdefault(name, []).append(fx)
-
-            group_info["leagues"].append(
-                {
-                    "league_name": league["name"],
-                    "league_url": league["url"],
-                    "venue": venue_info,
-                    "fixtures": league_fixtures,
-                    "teams": team_map,
-                }
-            )
 
-        all_data.append(group_info)
+async def build_leaguegroup_fixture_manifest(limit: int = None):
+    try:
+        async with aiohttp.ClientSession(headers=HTTP_HEADERS) as session:
+            league_groups = await fetch_league_names_and_urls(session)
+            if limit is not None:
+                league_groups = league_groups[:limit]
 
-        time.sleep(1)
+            all_data = await asyncio.gather(
+                *(
+                    build_group_info(session, group_name, group_url)
+                    for group_name, group_url in league_groups
+                )
+            )
+    finally:
+        PAGE_CACHE.save()
 
     return all_data
 
 
-def build_team_calendar(
-    fixtures: list[dict], team_name: str, location: str = DEFAULT_EVENT_LOCATION
-) -> Calendar:
-    cal = Calendar()
-    cal.creator = f"Fixtures for {team_name}"
+def build_league_events(
+    fixtures: list[dict], location: str = DEFAULT_EVENT_LOCATION
+) -> Iterator[str]:
     for fx in fixtures:
-        opponent = (
-            fx["away"]["name"]
-            if fx["home"]["name"] == team_name
-            else fx["home"]["name"]
+        home, away = fx["home"]["name"], fx["away"]["name"]
+        yield vevent(
+            event_uid(fx["league_url"], fx["datetime"].isoformat(), home, away),
+            fx["datetime"],
+            EVENT_DURATION,
+            f"{home} vs {away}",
+            location,
+            f"Result: {fx['result']}" if fx["result"] else None,
+        )
+
+
+def build_team_events(
+    team_fixtures: list[dict], location: str = DEFAULT_EVENT_LOCATION
+) -> Iterator[str]:
+    """
+    Render entries from a league's "teams" map, which already carry the
+    team and its opponent.
+    """
+    for entry in team_fixtures:
+        yield vevent(
+            event_uid(entry["team"], entry["opponent"], entry["datetime"].isoformat()),
+            entry["datetime"],
+            EVENT_DURATION,
+            f"{entry['team']} vs {entry['opponent']}",
+            location,
+            f"Result: {entry['result']}" if entry["result"] else None,
         )
-        event = Event()
-        event.name = f"{team_name} vs {opponent}"
-        event.begin = fx["datetime"]
-        event.duration = timedelta(hours=1)
-        event.location = location
-        if fx["result"]:
-            event.description = f"Result: {fx['result']}"
-        cal.events.add(event)
-    return cal
 
 
 def write_all_calendars(manifest):
     os.makedirs(OUTPUT_DIRECTORY, exist_ok=True)
 
+    # Calendars are serialized up front and the files written in parallel.
+    calendar_files: dict[str, str] = {}
+
+    # A team can play in more than one league, so its events are merged
+    # across leagues and each team file is written once at the end.
+    team_events: dict[str, tuple[str, list[str]]] = {}
+
     for group in manifest:
         group_name = group["group_name"].replace(" ", "_").lower()
 
@@ -341,25 +455,31 @@ def write_all_calendars(manifest):
                 OUTPUT_DIRECTORY, f"{group_name}__{league_name}.ics"
             )
 
-            venue_address = league.get("venue", {}).get(
-                "address", DEFAULT_EVENT_LOCATION
-            )
+            # A league page without a venue link leaves the address as None
+            venue_address = league["venue"].get("address") or DEFAULT_EVENT_LOCATION
 
-            league_calendar = build_team_calendar(
-                league["fixtures"], team_name="", location=venue_address
+            calendar_files[league_ics_path] = vcalendar(
+                f"Fixtures for {league['league_name']}",
+                build_league_events(league["fixtures"], location=venue_address),
             )
-            with open(league_ics_path, "w") as f:
-                f.writelines(league_calendar)
 
             # Per-team calendars
             for team_name, team_fixtures in league["teams"].items():
                 safe_team = team_name.replace(" ", "_").lower()
-                team_ics_path = os.path.join(OUTPUT_DIRECTORY, f"{safe_team}.ics")
-                team_calendar = build_team_calendar(
-                    team_fixtures, team_name, location=venue_address
-                )
-                with open(team_ics_path, "w") as f:
-                    f.writelines(team_calendar)
+                _, events = team_events.setdefault(safe_team, (team_name, []))
+                events.extend(build_team_events(team_fixtures, location=venue_address))
+
+    for safe_team, (team_name, events) in team_events.items():
+        team_ics_path = os.path.join(OUTPUT_DIRECTORY, f"{safe_team}.ics")
+        calendar_files[team_ics_path] = vcalendar(f"Fixtures for {team_name}", events)
+
+    with ThreadPoolExecutor(max_workers=ICS_WRITER_WORKERS) as pool:
+        futures = [
+            pool.submit(write_calendar, path, calendar_text)
+            for path, calendar_text in calendar_files.items()
+        ]
+        for future in futures:
+            future.result()
 
 
 def main() -> None:
@@ -382,14 +502,15 @@ def main() -> None:
     # )
 
     print("Building fixture manifest from all league groups...")
-    manifest = build_leaguegroup_fixture_manifest(limit=3)
-    # manifest = build_leaguegroup_fixture_manifest(None)
+    manifest = asyncio.run(build_leaguegroup_fixture_manifest(limit=3))
+    # manifest = asyncio.run(build_leaguegroup_fixture_manifest(None))
     print("Finished building manifest.\n")
     os.makedirs(OUTPUT_DIRECTORY, exist_ok=True)
-    with open(os.path.join(OUTPUT_DIRECTORY, "manifest.json"), "w") as f:
-        json.dump(
-            manifest, f, indent=2, default=str
-        )  # default=str to serialize datetime
+    with open(os.path.join(OUTPUT_DIRECTORY, "manifest.json"), "wb") as f:
+        # orjson serializes datetimes natively as ISO 8601
+        f.write(
+            orjson.dumps(manifest, option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC)
+        )
 
     print("Manifest saved to docs/manifest.json")
 
@@ -401,7 +522,7 @@ def main() -> None:
 
     # os.makedirs(OUTPUT_DIRECTORY, exist_ok=True)
     # with open(ICS_OUTPUT_PATH, "w") as output_file:
-    #    output_file.writelines(calendar)
+    #    output_file.write(calendar)
 
     # print(f"Wrote fixture calendar to {ICS_OUTPUT_PATH}")
 
@@ -2,39 +2,75 @@
 
 import os
 import re
-import time
 import sqlite3
+import asyncio
 import logging
-from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
-
-import requests
-from bs4 import BeautifulSoup
-from ics import Calendar, Event
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from hashlib import blake2b
+from itertools import chain
+
+import aiohttp
+from selectolax.lexbor import LexborHTMLParser
+
+from clive_fixtures.core import (
+    BASE_URL,
+    DEFAULT_EVENT_LOCATION,
+    EVENT_DURATION,
+    HTTP_HEADERS,
+    LEAGUE_PAGE_URL,
+    OUTPUT_DIRECTORY,
+    TIME_ZONE,
+    UTC,
+    event_uid,
+    vcalendar,
+    vevent,
+    write_calendar,
+)
 
 # ─── Configuration ─────────────────────────────────────────────────────────────
 
-BASE_URL = "https://footballmundial.com"
-LEAGUE_PAGE_URL = "https://footballmundial.com/find_league"
-HTTP_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible;)"}
-
-OUTPUT_DIRECTORY = "docs"
 DB_PATH = os.path.join(OUTPUT_DIRECTORY, "fixtures.db")
 
-DEFAULT_EVENT_LOCATION = "301 Huntington Rd, Huntington, York YO32 9WT"
-TIME_ZONE = ZoneInfo("Europe/London")
-UTC = ZoneInfo("UTC")
+# fixture.dt_utc is stored as e.g. 2025-01-31T19:30:00Z
+DT_UTC_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+# Cap on in-flight requests; requests only slow down when the site pushes back
+MAX_CONCURRENT_REQUESTS = 16
+MAX_RETRY_AFTER_SECONDS = 60
+PARSER_WORKERS = 4
+
+# Responses worth retrying; any other HTTP error fails straight away
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Responses that pause every request, honouring Retry-After when it is sent
+BACKOFF_STATUSES = frozenset({429, 503})
+
+_SLUG_RE = re.compile(r"\W+")
+_VENUE_HREF_RE = re.compile(r"^/info/venues/\d+")
+_ADDRESS_LABEL_RE = re.compile(r"^\s*Address\s*$")
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Use a single Session for all HTTP calls
-SESSION = requests.Session()
-SESSION.headers.update(HTTP_HEADERS)
-
 # Simple in-memory cache for venues to avoid re-fetching
 _venue_cache: dict[str, str] = {}
+_venue_address_tasks: dict[str, asyncio.Task] = {}
+
+# Row ids already in the DB, keyed by slug (venues by url), so repeat lookups
+# during the crawl skip SQLite entirely
+_league_group_ids: dict[str, int] = {}
+_league_ids: dict[str, int] = {}
+_venue_ids: dict[str, int] = {}
+_team_ids: dict[str, int] = {}
+
+_request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+# Event-loop time before which no new request is sent
+_paused_until = 0.0
+
+PARSER_POOL = ThreadPoolExecutor(max_workers=PARSER_WORKERS)
 
 
 # ─── SQLite Schema & Helpers ───────────────────────────────────────────────────
@@ -44,6 +80,14 @@ def init_db(db_path: str) -> sqlite3.Connection:
     os.makedirs(os.path.dirname(db_path), exist_ok=True)
     conn = sqlite3.connect(db_path)
     conn.execute("PRAGMA foreign_keys = ON;")
+    # The DB is a rebuildable crawl artifact, so trade durability for load speed.
+    # These only apply to this connection; the ICS phase reopens with defaults.
+    conn.executescript("""
+    PRAGMA journal_mode = MEMORY;
+    PRAGMA synchronous = OFF;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -65536;
+    """)
     cursor = conn.cursor()
 
     # 1) league_group
@@ -99,126 +143,211 @@ def init_db(db_path: str) -> sqlite3.Connection:
     );
     """)
 
+    # 6) team_ics_hash: digest of each team's last written calendar
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS team_ics_hash (
+        slug TEXT PRIMARY KEY,
+        hash BLOB NOT NULL
+    );
+    """)
+
+    # 7) indexes for the ICS-build lookups by league and by team
+    cursor.executescript("""
+    CREATE INDEX IF NOT EXISTS idx_fixture_league_dt ON fixture(league_id, dt_utc);
+    CREATE INDEX IF NOT EXISTS idx_fixture_home ON fixture(home_team_id, dt_utc);
+    CREATE INDEX IF NOT EXISTS idx_fixture_away ON fixture(away_team_id, dt_utc);
+    CREATE INDEX IF NOT EXISTS idx_league_group ON league(league_group_id);
+    """)
+
+    # Older databases stored dt_utc with a +00:00 offset instead of Z
+    cursor.execute("""
+    UPDATE fixture SET dt_utc = replace(dt_utc, '+00:00', 'Z')
+    WHERE dt_utc LIKE '%+00:00';
+    """)
+
     conn.commit()
     return conn
 
 
+# Team names repeat across every fixture they play, so most calls are cache hits
+@lru_cache(maxsize=None)
 def slugify(text: str) -> str:
-    return re.sub(r"\W+", "_", text.strip().lower()).strip("_")
+    return _SLUG_RE.sub("_", text.strip().lower()).strip("_")
+
+
+def prime_lookup_caches(conn: sqlite3.Connection):
+    """
+    Load rows left by earlier runs into the lookup caches. Venues whose address
+    was never resolved stay out, so they are fetched and upserted again.
+    """
+    _league_group_ids.update(conn.execute("SELECT slug, id FROM league_group"))
+    _league_ids.update(conn.execute("SELECT slug, id FROM league"))
+    for url, venue_id, address in conn.execute(
+        "SELECT url, id, address FROM venue WHERE address IS NOT NULL AND address != ?",
+        (DEFAULT_EVENT_LOCATION,),
+    ):
+        _venue_ids[url] = venue_id
+        _venue_cache[url] = address
+    _team_ids.update(conn.execute("SELECT slug, id FROM team"))
 
 
 def get_or_create_league_group(conn: sqlite3.Connection, group_name: str) -> int:
     slug = slugify(group_name)
-    cur = conn.cursor()
-    cur.execute(
-        "INSERT OR IGNORE INTO league_group(name, slug) VALUES (?, ?)",
+    if slug in _league_group_ids:
+        return _league_group_ids[slug]
+    cur = conn.execute(
+        """
+        INSERT INTO league_group(name, slug) VALUES (?, ?)
+        ON CONFLICT(slug) DO UPDATE SET slug = excluded.slug
+        RETURNING id
+    """,
         (group_name, slug),
     )
-    conn.commit()
-    cur.execute("SELECT id FROM league_group WHERE slug = ?", (slug,))
-    return cur.fetchone()[0]
+    _league_group_ids[slug] = cur.fetchone()[0]
+    return _league_group_ids[slug]
 
 
 def get_or_create_league(
     conn: sqlite3.Connection, group_id: int, league_name: str, league_url: str
 ) -> int:
     slug = slugify(league_name)
-    cur = conn.cursor()
-    cur.execute(
-        "INSERT OR IGNORE INTO league(league_group_id, name, url, slug) VALUES (?, ?, ?, ?)",
+    if slug in _league_ids:
+        return _league_ids[slug]
+    cur = conn.execute(
+        """
+        INSERT INTO league(league_group_id, name, url, slug) VALUES (?, ?, ?, ?)
+        ON CONFLICT(slug) DO UPDATE SET slug = excluded.slug
+        RETURNING id
+    """,
         (group_id, league_name, league_url, slug),
     )
-    conn.commit()
-    cur.execute("SELECT id FROM league WHERE slug = ?", (slug,))
-    return cur.fetchone()[0]
+    _league_ids[slug] = cur.fetchone()[0]
+    return _league_ids[slug]
 
 
 def get_or_create_venue(conn: sqlite3.Connection, venue_dict: dict) -> int | None:
     url = venue_dict.get("url")
     if not url:
         return None
+    if url in _venue_ids:
+        return _venue_ids[url]
 
-    cur = conn.cursor()
-    cur.execute(
-        "INSERT OR IGNORE INTO venue(url, name, address) VALUES (?, ?, ?)",
+    cur = conn.execute(
+        """
+        INSERT INTO venue(url, name, address) VALUES (?, ?, ?)
+        ON CONFLICT(url) DO UPDATE SET address = excluded.address
+        RETURNING id
+    """,
         (url, venue_dict["name"], venue_dict["address"]),
     )
-    conn.commit()
-    cur.execute("SELECT id FROM venue WHERE url = ?", (url,))
-    row = cur.fetchone()
-    return row[0] if row else None
+    _venue_ids[url] = cur.fetchone()[0]
+    return _venue_ids[url]
 
 
 def get_or_create_team(conn: sqlite3.Connection, team_name: str) -> int:
     slug = slugify(team_name)
-    cur = conn.cursor()
-    cur.execute(
-        "INSERT OR IGNORE INTO team(name, slug) VALUES (?, ?)", (team_name, slug)
+    if slug in _team_ids:
+        return _team_ids[slug]
+    cur = conn.execute(
+        """
+        INSERT INTO team(name, slug) VALUES (?, ?)
+        ON CONFLICT(slug) DO UPDATE SET slug = excluded.slug
+        RETURNING id
+    """,
+        (team_name, slug),
     )
-    conn.commit()
-    cur.execute("SELECT id FROM team WHERE slug = ?", (slug,))
-    return cur.fetchone()[0]
+    _team_ids[slug] = cur.fetchone()[0]
+    return _team_ids[slug]
 
 
-def insert_fixture(
-    conn: sqlite3.Connection,
-    league_id: int,
-    venue_id: int,
-    home_id: int,
-    away_id: int,
-    dt_iso: str,
-    result: str,
-) -> int | None:
-    cur = conn.cursor()
-    try:
-        cur.execute(
-            """
-            INSERT INTO fixture(league_id, venue_id, home_team_id, away_team_id, dt_utc, result)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """,
-            (league_id, venue_id, home_id, away_id, dt_iso, result),
-        )
-        conn.commit()
-        return cur.lastrowid
-    except sqlite3.IntegrityError:
-        return None
+def insert_fixtures(conn: sqlite3.Connection, rows: list[tuple]) -> None:
+    """
+    Insert (league_id, venue_id, home_id, away_id, dt_iso, result) rows in one
+    executemany, skipping fixtures that are already stored.
+    """
+    conn.executemany(
+        """
+        INSERT OR IGNORE INTO fixture(league_id, venue_id, home_team_id, away_team_id, dt_utc, result)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """,
+        rows,
+    )
 
 
 # ─── HTTP Helpers ───────────────────────────────────────────────────────────────
 
 
-def safe_get(full_url: str) -> requests.Response | None:
+async def safe_get(session: aiohttp.ClientSession, full_url: str) -> str | None:
     """
-    Perform up to 3 attempts to GET full_url. On success, return Response.
-    On repeated failure, log an error and return None.
+    Perform up to 3 attempts to GET full_url. On success, return the page text.
+    Connection errors and RETRY_STATUSES are retried; on repeated failure, or
+    any other HTTP error, log an error and return None.
+    A 429/503 pauses all requests for its Retry-After (or the backoff delay).
     """
+    global _paused_until
+    loop = asyncio.get_running_loop()
     for attempt in range(1, 4):
+        backoff = 2 ** (attempt - 1)  # 1s, then 2s, then 4s
         try:
-            resp = SESSION.get(full_url)
-            resp.raise_for_status()
-            return resp
-        except requests.RequestException as e:
+            async with _request_semaphore:
+                pause = _paused_until - loop.time()
+                if pause > 0:
+                    await asyncio.sleep(pause)
+                async with session.get(full_url) as resp:
+                    resp.raise_for_status()
+                    return await resp.text()
+        except aiohttp.ClientResponseError as e:
+            if e.status not in RETRY_STATUSES:
+                logger.error("GET %s failed: %s", full_url, e)
+                return None
             logger.warning("GET %s failed (attempt %d/3): %s", full_url, attempt, e)
-            time.sleep(2 ** (attempt - 1))  # 1s, then 2s, then 4s
+            if e.status in BACKOFF_STATUSES:
+                backoff = _retry_after_seconds(e.headers, backoff)
+                _paused_until = max(_paused_until, loop.time() + backoff)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning("GET %s failed (attempt %d/3): %s", full_url, attempt, e)
+        await asyncio.sleep(backoff)
     logger.error("Giving up on %s after 3 attempts.", full_url)
     return None
 
 
+def _retry_after_seconds(headers, default: float) -> float:
+    """
+    Read a Retry-After header (delta-seconds or HTTP-date), capped at
+    MAX_RETRY_AFTER_SECONDS. Fall back to default if it is missing or invalid.
+    """
+    value = headers.get("Retry-After") if headers else None
+    if not value:
+        return default
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return default
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=UTC)
+        seconds = (retry_at - datetime.now(UTC)).total_seconds()
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS)
+
+
 # ─── Fetch & Parse Helpers ────────────────────────────────────────────────────
 
 
-def fetch_league_names_and_urls() -> list[tuple[str, str]]:
+async def fetch_league_names_and_urls(
+    session: aiohttp.ClientSession,
+) -> list[tuple[str, str]]:
     """
     Return a list of (league_group_name, league_group_relative_url).
     """
-    resp = safe_get(LEAGUE_PAGE_URL)
-    if not resp:
+    html = await safe_get(session, LEAGUE_PAGE_URL)
+    if not html:
         return []
 
-    soup = BeautifulSoup(resp.text, "html.parser")
-    select = soup.find(
-        "select",
-        attrs={"onchange": "location = this.options[this.selectedIndex].value;"},
+    tree = LexborHTMLParser(html)
+    select = tree.css_first(
+        'select[onchange="location = this.options[this.selectedIndex].value;"]'
     )
     if not select:
         logger.error(
@@ -227,41 +356,44 @@ def fetch_league_names_and_urls() -> list[tuple[str, str]]:
         return []
 
     leagues: list[tuple[str, str]] = []
-    for opt in select.find_all("option"):
-        name = opt.get_text(strip=True)
-        relative = opt.get("value", "").strip()
+    for opt in select.css("option"):
+        name = opt.text(strip=True)
+        relative = (opt.attributes.get("value") or "").strip()
         if relative and relative != "/find_league":
             leagues.append((name, relative))
     return leagues
 
 
-def parse_league_group(group_name: str, group_url: str) -> list[dict]:
+async def parse_league_group(
+    session: aiohttp.ClientSession, group_name: str, group_url: str
+) -> list[dict]:
     """
     Parse a single league group page (BASE_URL + group_url) and return
     [{"name": league_name, "url": league_relative_url}, ...].
     """
     full = BASE_URL + group_url
-    resp = safe_get(full)
-    if not resp:
+    html = await safe_get(session, full)
+    if not html:
         return []
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    tree = LexborHTMLParser(html)
     parsed = []
     # Use a CSS selector to find all <h4 class="panel-title"> under the correct container
-    for league_h4 in soup.select("div.col-lg-12 div.panel-heading h4.panel-title"):
-        link = league_h4.find("a", href=True)
+    for league_h4 in tree.css("div.col-lg-12 div.panel-heading h4.panel-title"):
+        link = league_h4.css_first("a[href]")
         if not link:
             continue
-        league_name = league_h4.get_text(strip=True).split("View Fixtures")[0].strip()
-        league_rel = link["href"]
+        league_name = league_h4.text(strip=True).split("View Fixtures")[0].strip()
+        league_rel = link.attributes["href"]
         if league_rel:
             parsed.append({"name": league_name, "url": league_rel})
     return parsed
 
 
-def fetch_venue_address(venue_url: str) -> str:
+async def fetch_venue_address(session: aiohttp.ClientSession, venue_url: str) -> str:
     """
-    Given a relative venue URL, return the address text. Cached in _venue_cache.
+    Given a relative venue URL, return the address text. Cached in _venue_cache;
+    leagues sharing a venue await the same in-flight fetch.
     """
     if not venue_url:
         return DEFAULT_EVENT_LOCATION
@@ -269,28 +401,40 @@ def fetch_venue_address(venue_url: str) -> str:
     if venue_url in _venue_cache:
         return _venue_cache[venue_url]
 
+    if venue_url not in _venue_address_tasks:
+        _venue_address_tasks[venue_url] = asyncio.create_task(
+            _scrape_venue_address(session, venue_url)
+        )
+    return await _venue_address_tasks[venue_url]
+
+
+async def _scrape_venue_address(session: aiohttp.ClientSession, venue_url: str) -> str:
     full = BASE_URL + venue_url
-    resp = safe_get(full)
-    if not resp:
+    html = await safe_get(session, full)
+    if not html:
         # If the GET failed repeatedly, fallback to default
         _venue_cache[venue_url] = DEFAULT_EVENT_LOCATION
         return DEFAULT_EVENT_LOCATION
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    tree = LexborHTMLParser(html)
     # Look for <p> that is exactly "Address"
-    address_block = soup.find("p", string=re.compile(r"^\s*Address\s*$"))
+    address_block = next(
+        (p for p in tree.css("p") if _ADDRESS_LABEL_RE.match(p.text())), None
+    )
     if not address_block:
         _venue_cache[venue_url] = DEFAULT_EVENT_LOCATION
         return DEFAULT_EVENT_LOCATION
 
-    container = address_block.find_parent("div")
+    container = address_block.parent
+    while container is not None and container.tag != "div":
+        container = container.parent
     if not container:
         _venue_cache[venue_url] = DEFAULT_EVENT_LOCATION
         return DEFAULT_EVENT_LOCATION
 
     lines = []
-    for p in container.find_all("p")[1:]:
-        txt = p.get_text(strip=True)
+    for p in container.css("p")[1:]:
+        txt = p.text(strip=True)
         if txt:
             lines.append(txt)
     address = ", ".join(lines) if lines else DEFAULT_EVENT_LOCATION
@@ -298,7 +442,9 @@ def fetch_venue_address(venue_url: str) -> str:
     return address
 
 
-def extract_fixtures_from_league(league_url: str) -> tuple[list[dict], dict]:
+async def extract_fixtures_from_league(
+    session: aiohttp.ClientSession, league_url: str
+) -> tuple[list[dict], dict]:
     """
     Hit BASE_URL + league_url and parse all fixtures (past + upcoming).
     Return (fixtures_list, venue_dict).
@@ -311,21 +457,36 @@ def extract_fixtures_from_league(league_url: str) -> tuple[list[dict], dict]:
     venue_dict: { "name": str, "url": str|None, "address": str }
     """
     full = BASE_URL + league_url
-    resp = safe_get(full)
-    if not resp:
+    html = await safe_get(session, full)
+    if not html:
         return [], {"name": "Unknown", "url": None, "address": DEFAULT_EVENT_LOCATION}
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    # Parse on PARSER_POOL so other pages' downloads keep moving meanwhile
+    loop = asyncio.get_running_loop()
+    fixtures, venue = await loop.run_in_executor(PARSER_POOL, _parse_league_page, html)
+    if venue["url"]:
+        venue["address"] = await fetch_venue_address(session, venue["url"])
+    return fixtures, venue
+
+
+def _parse_league_page(html: str) -> tuple[list[dict], dict]:
+    tree = LexborHTMLParser(html)
 
     # 1) Find venue link & address
-    venue_link = soup.find("a", href=re.compile(r"^/info/venues/\d+"))
+    venue_link = next(
+        (
+            link
+            for link in tree.css('a[href^="/info/venues/"]')
+            if _VENUE_HREF_RE.match(link.attributes["href"])
+        ),
+        None,
+    )
     if venue_link:
         venue = {
-            "name": venue_link.get_text(strip=True),
-            "url": venue_link["href"],
+            "name": venue_link.text(strip=True),
+            "url": venue_link.attributes["href"],
             "address": None,
         }
-        venue["address"] = fetch_venue_address(venue["url"])
     else:
         venue = {"name": "Unknown", "url": None, "address": DEFAULT_EVENT_LOCATION}
 
@@ -333,61 +494,64 @@ def extract_fixtures_from_league(league_url: str) -> tuple[list[dict], dict]:
 
     # 2) Two accordion sections: upcoming & results
     for section_id in ("fixtures_accordion_fixtures", "fixtures_accordion_results"):
-        acc = soup.find("div", id=section_id)
+        acc = tree.css_first(f"div#{section_id}")
         if not acc:
             continue
-        # Each date header is <div class="panel-heading"><h4 class="panel-title">DD-MM-YYYY</h4>…
-        for panel in acc.find_all("div", class_="panel-heading"):
-            title_tag = panel.find("h4", class_="panel-title")
-            if not title_tag:
+        # Date headers (<div class="panel-heading"><h4 class="panel-title">
+        # DD-MM-YYYY</h4>…) and the rows of the table under each one come back
+        # from one query in document order, so every row belongs to the most
+        # recent heading seen. Rows under a heading without a valid date are
+        # dropped.
+        match_date = None
+        for node in acc.css(
+            "div.panel-heading, div.panel-collapse table.table-striped tbody tr"
+        ):
+            if node.tag == "div":
+                match_date = None
+                title_tag = node.css_first("h4.panel-title")
+                if not title_tag:
+                    continue
+                date_text = title_tag.text(strip=True).replace("View:", "").strip()
+                try:
+                    match_date = datetime.strptime(date_text, "%d-%m-%Y").date()
+                except ValueError:
+                    pass
                 continue
-            date_text = title_tag.get_text(strip=True).replace("View:", "").strip()
-            try:
-                match_date = datetime.strptime(date_text, "%d-%m-%Y").date()
-            except ValueError:
+            if match_date is None:
                 continue
 
-            # The sibling <div class="panel-collapse"> contains a table
-            content_div = panel.find_next_sibling("div", class_="panel-collapse")
-            if not content_div:
+            cells = node.css("td")
+            if len(cells) < 4:
                 continue
-            table = content_div.find("table", class_="table-striped")
-            if not table:
+            time_str = cells[0].text(strip=True)
+            try:
+                fixture_time = datetime.strptime(time_str, "%H:%M").time()
+            except ValueError:
                 continue
 
-            for row in table.select("tbody tr"):
-                cells = row.find_all("td")
-                if len(cells) < 4:
-                    continue
-                time_str = cells[0].get_text(strip=True)
-                try:
-                    fixture_time = datetime.strptime(time_str, "%H:%M").time()
-                except ValueError:
-                    continue
-
-                dt_local = datetime.combine(match_date, fixture_time).replace(
-                    tzinfo=TIME_ZONE
-                )
+            dt_local = datetime.combine(match_date, fixture_time).replace(
+                tzinfo=TIME_ZONE
+            )
 
-                home_link = cells[1].find("a", href=True)
-                away_link = cells[3].find("a", href=True)
-                if not home_link or not away_link:
-                    continue
+            home_link = cells[1].css_first("a[href]")
+            away_link = cells[3].css_first("a[href]")
+            if not home_link or not away_link:
+                continue
 
-                result_text = None
-                if section_id == "fixtures_accordion_results":
-                    result_text = cells[2].get_text(strip=True)
-
-                fixtures.append(
-                    {
-                        "dt": dt_local,
-                        "home_name": home_link.get_text(strip=True),
-                        "home_url": home_link["href"],
-                        "away_name": away_link.get_text(strip=True),
-                        "away_url": away_link["href"],
-                        "result": result_text,
-                    }
-                )
+            result_text = None
+            if section_id == "fixtures_accordion_results":
+                result_text = cells[2].text(strip=True)
+
+            fixtures.append(
+                {
+                    "dt": dt_local,
+                    "home_name": home_link.text(strip=True),
+                    "home_url": home_link.attributes["href"],
+                    "away_name": away_link.text(strip=True),
+                    "away_url": away_link.attributes["href"],
+                    "result": result_text,
+                }
+            )
 
     return fixtures, venue
 
@@ -395,39 +559,63 @@ def extract_fixtures_from_league(league_url: str) -> tuple[list[dict], dict]:
 # ─── Main Crawl Loop ───────────────────────────────────────────────────────────
 
 
-def crawl_and_populate_db(limit: int | None = None):
+async def crawl_and_populate_db(
+    session: aiohttp.ClientSession, limit: int | None = None
+):
     """
     Crawl up to `limit` league groups (or all if None), parse leagues & fixtures,
     insert everything into SQLite. Uses a single DB transaction for the entire run.
+    Pages are downloaded concurrently, and each league's rows are inserted as
+    soon as its page has been parsed.
     """
     conn = init_db(DB_PATH)
-    league_groups = fetch_league_names_and_urls()
+    prime_lookup_caches(conn)
+    league_groups = await fetch_league_names_and_urls(session)
     if limit:
         league_groups = league_groups[:limit]
 
+    groups_leagues = await asyncio.gather(
+        *(
+            parse_league_group(session, group_name, group_url)
+            for group_name, group_url in league_groups
+        )
+    )
+
+    async def crawl_league(lg_id: int, league_info: dict):
+        fixtures, venue_dict = await extract_fixtures_from_league(
+            session, league_info["url"]
+        )
+        return lg_id, league_info, fixtures, venue_dict
+
     # Batch everything in one transaction to reduce commits
     with conn:
-        for group_name, group_url in league_groups:
+        league_tasks = []
+        for (group_name, _group_url), parsed_leagues in zip(
+            league_groups, groups_leagues
+        ):
             logger.info("Processing league group: %s", group_name)
             lg_id = get_or_create_league_group(conn, group_name)
-
-            parsed_leagues = parse_league_group(group_name, group_url)
-            for league_info in parsed_leagues:
-                league_name = league_info["name"]
-                league_url = league_info["url"]
-                logger.info("  └── League: %s", league_name)
-
-                league_id = get_or_create_league(conn, lg_id, league_name, league_url)
-
-                fixtures, venue_dict = extract_fixtures_from_league(league_url)
-                venue_id = get_or_create_venue(conn, venue_dict)
-
-                for fx in fixtures:
-                    home_tid = get_or_create_team(conn, fx["home_name"])
-                    away_tid = get_or_create_team(conn, fx["away_name"])
-                    dt_utc = fx["dt"].astimezone(UTC).isoformat()
-                    insert_fixture(
-                        conn,
+            league_tasks.extend(
+                crawl_league(lg_id, league_info) for league_info in parsed_leagues
+            )
+
+        # Drain leagues in completion order; all DB writes stay on this coroutine
+        for next_league in asyncio.as_completed(league_tasks):
+            lg_id, league_info, fixtures, venue_dict = await next_league
+            league_name = league_info["name"]
+            league_url = league_info["url"]
+            logger.info("  └── League: %s", league_name)
+
+            league_id = get_or_create_league(conn, lg_id, league_name, league_url)
+            venue_id = get_or_create_venue(conn, venue_dict)
+
+            fixture_rows = []
+            for fx in fixtures:
+                home_tid = get_or_create_team(conn, fx["home_name"])
+                away_tid = get_or_create_team(conn, fx["away_name"])
+                dt_utc = fx["dt"].astimezone(UTC).strftime(DT_UTC_FORMAT)
+                fixture_rows.append(
+                    (
                         league_id,
                         venue_id,
                         home_tid,
@@ -435,9 +623,8 @@ def crawl_and_populate_db(limit: int | None = None):
                         dt_utc,
                         fx["result"],
                     )
-
-                # Throttle—reduce if the site allows faster
-                time.sleep(0.5)
+                )
+            insert_fixtures(conn, fixture_rows)
 
     conn.close()
     logger.info("Done crawling & populating SQLite.")
@@ -457,36 +644,47 @@ def _build_ics(
     """
     Generic ICS builder.
     - `query, params` fetch (fid, h_id, h_name, a_id, a_name, dt_utc, result, venue_addr).
-    - `creator_text` goes into Calendar.creator.
+    - `creator_text` goes into the calendar's PRODID.
     - `event_namer` is a callable(f_row) → (event_name:str, event_desc:str|None).
     """
-    cur = conn.cursor()
-    rows = cur.execute(query, params).fetchall()
-    if not rows:
+    cur = conn.execute(query, params)
+    first_row = cur.fetchone()
+    if first_row is None:
         logger.info("No data for ICS at %s", output_path)
         return
 
-    cal = Calendar()
-    cal.creator = creator_text
+    def events():
+        # Rows stream straight from the cursor into the calendar text
+        for row in chain((first_row,), cur):
+            fid, h_id, h_name, a_id, a_name, dt_iso, result, venue_addr = row
+            name, desc = event_namer(row)
+            yield _fixture_vevent(name, h_name, a_name, dt_iso, venue_addr, desc)
+
+    _write_ics(vcalendar(creator_text, events()), output_path)
 
-    for row in rows:
-        fid, h_id, h_name, a_id, a_name, dt_iso, result, venue_addr = row
-        dt_obj = datetime.fromisoformat(dt_iso).astimezone(TIME_ZONE)
-        venue_loc = venue_addr or DEFAULT_EVENT_LOCATION
 
-        name, desc = event_namer(row)
-        e = Event()
-        e.name = name
-        e.begin = dt_obj
-        e.duration = timedelta(hours=1)
-        e.location = venue_loc
-        if desc:
-            e.description = desc
-        cal.events.add(e)
+def _fixture_vevent(
+    name: str,
+    h_name: str,
+    a_name: str,
+    dt_iso: str,
+    venue_addr: str | None,
+    desc: str | None,
+) -> str:
+    return vevent(
+        event_uid(h_name, a_name, dt_iso),
+        # 2025-01-31T19:30:00Z → 20250131T193000Z, no datetime needed
+        dt_iso.replace("-", "").replace(":", ""),
+        EVENT_DURATION,
+        name,
+        venue_addr or DEFAULT_EVENT_LOCATION,
+        desc,
+    )
 
+
+def _write_ics(calendar_text: str, output_path: str):
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, "w") as f:
-        f.writelines(cal)
+    write_calendar(output_path, calendar_text)
     logger.info("Wrote ICS: %s", output_path)
 
 
@@ -532,59 +730,78 @@ def build_league_ics(conn: sqlite3.Connection, league_slug: str, output_path: st
     _build_ics(conn, query, params, creator, event_namer, output_path)
 
 
-def build_team_ics(conn: sqlite3.Connection, team_slug: str, output_path: str):
-    cur = conn.cursor()
-    cur.execute("SELECT id, name FROM team WHERE slug = ?", (team_slug,))
-    row = cur.fetchone()
-    if not row:
-        logger.warning("No team found for slug=%s", team_slug)
-        return
-    team_id, team_name = row
-
+def build_all_team_ics(conn: sqlite3.Connection, output_dir: str):
+    """
+    Write every team's ICS from a single pass over fixture, routing each row
+    into both the home and the away team's calendar. Calendars whose digest
+    matches team_ics_hash are left untouched on disk.
+    """
     query = """
-        SELECT f.id,
-               f.home_team_id, t1.name AS home_name,
-               f.away_team_id, t2.name AS away_name,
+        SELECT t1.slug, t1.name, t2.slug, t2.name,
                f.dt_utc, f.result,
                COALESCE(v.address, ?) AS address
         FROM fixture f
         JOIN team t1 ON f.home_team_id = t1.id
         JOIN team t2 ON f.away_team_id = t2.id
         LEFT JOIN venue v ON f.venue_id = v.id
-        WHERE f.home_team_id = ? OR f.away_team_id = ?
         ORDER BY f.dt_utc ASC
     """
-    params = (DEFAULT_EVENT_LOCATION, team_id, team_id)
-    creator = f"-//Fixtures for team {team_name}//EN"
-
-    def event_namer(r):
-        _fid, h_id, h_name, a_id, a_name, _dt_iso, result, _venue_addr = r
-        if h_id == team_id:
-            opponent = a_name
-            name = f"{team_name} vs {opponent}"
-        else:
-            opponent = h_name
-            name = f"{team_name} vs {opponent}"
+    creators: dict[str, str] = {}
+    team_events: dict[str, list[str]] = {}
+    for h_slug, h_name, a_slug, a_name, dt_iso, result, venue_addr in conn.execute(
+        query, (DEFAULT_EVENT_LOCATION,)
+    ):
         desc = f"Result: {result}" if result else None
-        return name, desc
-
-    _build_ics(conn, query, params, creator, event_namer, output_path)
+        sides = [(h_slug, h_name, a_name)]
+        if a_slug != h_slug:
+            sides.append((a_slug, a_name, h_name))
+        for slug, team_name, opponent in sides:
+            if slug not in team_events:
+                creators[slug] = f"-//Fixtures for team {team_name}//EN"
+                team_events[slug] = []
+            name = f"{team_name} vs {opponent}"
+            team_events[slug].append(
+                _fixture_vevent(name, h_name, a_name, dt_iso, venue_addr, desc)
+            )
+
+    stored_hashes = dict(conn.execute("SELECT slug, hash FROM team_ics_hash"))
+    unchanged = 0
+    for slug, events in team_events.items():
+        output_path = os.path.join(output_dir, f"{slug}.ics")
+        calendar_text = vcalendar(creators[slug], events)
+        digest = blake2b(calendar_text.encode("utf-8"), digest_size=16).digest()
+        if stored_hashes.get(slug) == digest and os.path.exists(output_path):
+            unchanged += 1
+            continue
+        _write_ics(calendar_text, output_path)
+        conn.execute(
+            """
+            INSERT INTO team_ics_hash(slug, hash) VALUES (?, ?)
+            ON CONFLICT(slug) DO UPDATE SET hash = excluded.hash
+        """,
+            (slug, digest),
+        )
+    logger.info("Skipped %d unchanged team ICS files.", unchanged)
 
 
 # ─── Entrypoint ────────────────────────────────────────────────────────────────
 
 
+async def main_async():
+    # One keep-alive connection per request slot; aiohttp already asks for gzip
+    connector = aiohttp.TCPConnector(limit_per_host=MAX_CONCURRENT_REQUESTS)
+    async with aiohttp.ClientSession(
+        connector=connector, headers=HTTP_HEADERS
+    ) as session:
+        await crawl_and_populate_db(session, None)
+
+
 def main():
-    crawl_and_populate_db(None)
+    asyncio.run(main_async())
 
     with sqlite3.connect(DB_PATH) as conn:
-        # Generate all league ICS
-        cur = conn.cursor()
-
-        cur.execute("SELECT slug FROM team;")
-        for (slug,) in cur.fetchall():
-            ics_path = os.path.join(OUTPUT_DIRECTORY, f"{slug}.ics")
-            build_team_ics(conn, slug, ics_path)
+        # Generate all team ICS
+        build_all_team_ics(conn, OUTPUT_DIRECTORY)
 
     logger.info("All ICS files generated.")
 